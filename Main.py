@@ -6,7 +6,7 @@ and traffic patterns. Performs both technical analysis and visualization.
 
 Key Features:
 - Automated log file download from GitHub (streamed, size-limited)
-- Single-pass IP counting + deferred flagging
+- Parallel single read of the log file with deferred high-request flagging
 - Bot detection using user agent analysis
 - Suspicious activity identification
 - Comprehensive visualization dashboard
@@ -15,16 +15,21 @@ Key Features:
 
 import re
 import os
+import calendar
 import logging
-from datetime import datetime
-from dataclasses import dataclass
-from collections import Counter
+import mmap
+import multiprocessing
+from array import array
+from functools import lru_cache
+from dataclasses import dataclass, field
+from itertools import islice
+from collections import Counter, defaultdict
 from typing import Optional
 
-import matplotlib
-matplotlib.use("Agg")  # Non-interactive backend — must be set before importing pyplot
-import matplotlib.pyplot as plt
-import requests
+import numpy as np
+
+# matplotlib and requests are imported where they are used, so analysis
+# worker processes and runs with a cached log never pay for them
 
 # ---------------------------------------------------------------------------
 # Configuration constants
@@ -34,21 +39,36 @@ GITHUB_LOG_URL = "https://raw.githubusercontent.com/brightnetwork/ieuk-task-2025
 LOCAL_LOG_FILE = "sample-log.log"
 
 OUTPUT_DIR = os.environ.get("OUTPUT_DIR", "output")
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", os.cpu_count() or 1))
 
 HIGH_REQUEST_THRESHOLD = 30
 SLOW_RESPONSE_MS = 500
 LARGE_TRANSFER_BYTES = 1_000_000
+RESPONSE_TIME_BINS = 50
 DOWNLOAD_TIMEOUT_S = 30
 MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024  # 50 MB
+DOWNLOAD_CHUNK_BYTES = 1 << 20  # Bytes written to disk per streamed chunk
+READ_BLOCK_BYTES = 4 << 20  # Log bytes split into lines at a time
+WRITE_BUFFER_BYTES = 1 << 20  # 1 MB write buffer for the report file
+MIN_LINE_BYTES_ESTIMATE = 80  # Used to size per-line buffers from the file size
+MIN_CHUNK_BYTES = 4 * 1024 * 1024  # Smaller files are analysed in-process
+MAX_RESPONSE_TIME_MS = 2**31 - 1  # Largest value the int32 response time column holds
+MAX_BYTES_SENT = 2**63 - 1  # Largest value the int64 bytes sent column holds
 
 # ---------------------------------------------------------------------------
 # Compiled regex patterns (compiled once at import time)
 # ---------------------------------------------------------------------------
 
-LOG_PATTERN = re.compile(
-    r'^(\S+) - (\S+) - \[(.*?)\] "(\S+) (\S+) (\S+)" (\d{3}) (\d+) "([^"]*)" "([^"]*)" (\d+)$'
+# LOG_RE and IP_PREFIX_RE run on raw bytes read from the log file; LOG_RE
+# is applied with fullmatch and tolerates surrounding whitespace, so lines
+# need not be stripped first
+LOG_RE = re.compile(
+    rb'\s*(\S+) - (\S+) - \[(.*?)\] "(\S+) (\S+) (\S+)" (\d{3}) (\d+) "([^"]*)" "([^"]*)" (\d+)\s*'
 )
 
+# Whitespace that \S rejects but a split on b" " would not
+OTHER_WHITESPACE_RE = re.compile(rb'[\t\r\x0b\x0c]')
+
 SUSPICIOUS_PATH_RE = re.compile(
     r'(admin|login|wp-admin|\.php|\.env|config|\.\./|/cgi-bin/)',
     re.IGNORECASE,
@@ -62,6 +82,54 @@ BOT_RE = re.compile(
     re.IGNORECASE,
 )
 
+BOT_NAME_RE = re.compile(r'(\w+bot/[\d.]+|\w+bot)', re.IGNORECASE)
+
+IP_PREFIX_RE = re.compile(rb'^(\S+) -')
+
+# dd/mm/YYYY:HH:MM:SS
+TS_RE = re.compile(r'(\d{2})/(\d{2})/(\d{4}):(\d{2}):(\d{2}):(\d{2})')
+
+# ---------------------------------------------------------------------------
+# Issue flags and messages (built once so every flagged line shares the same objects)
+# ---------------------------------------------------------------------------
+
+FLAG_HIGH_REQ = 1 << 0
+FLAG_BOT = 1 << 1
+FLAG_HTTP_ERROR = 1 << 2
+FLAG_SLOW = 1 << 3
+FLAG_MISSING_UA = 1 << 4
+FLAG_SUSP_PATH = 1 << 5
+FLAG_AUTH_FAIL = 1 << 6
+FLAG_BAD_TS = 1 << 7
+FLAG_LARGE = 1 << 8
+
+MSG_HIGH_REQ = "High request count (potential bot)"
+MSG_BOT = "Bot detected"
+MSG_SLOW = "Slow response (>500ms)"
+MSG_MISSING_UA = "Missing user agent"
+MSG_SUSP_PATH = "Suspicious path"
+MSG_AUTH_FAIL = "Authentication failed"
+MSG_BAD_TS = "Invalid timestamp"
+MSG_LARGE = "Large transfer (>1MB)"
+MSG_MALFORMED = "Malformed log entry"
+
+CLIENT_ERR_MSG = {code: f"Client error ({code})" for code in range(400, 500)}
+SERVER_ERR_MSG = {code: f"Server error ({code})" for code in range(500, 600)}
+
+# In the order issues are listed for an entry; FLAG_HTTP_ERROR's message
+# depends on the status code (see http_error_message)
+ISSUE_FLAGS = (
+    (FLAG_HIGH_REQ, MSG_HIGH_REQ),
+    (FLAG_BOT, MSG_BOT),
+    (FLAG_HTTP_ERROR, None),
+    (FLAG_SLOW, MSG_SLOW),
+    (FLAG_MISSING_UA, MSG_MISSING_UA),
+    (FLAG_SUSP_PATH, MSG_SUSP_PATH),
+    (FLAG_AUTH_FAIL, MSG_AUTH_FAIL),
+    (FLAG_BAD_TS, MSG_BAD_TS),
+    (FLAG_LARGE, MSG_LARGE),
+)
+
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
@@ -77,7 +145,7 @@ log = logging.getLogger(__name__)
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 #These can be configured
 class LogEntry:
     ip: str
@@ -93,19 +161,91 @@ class LogEntry:
     response_time: int
 
 
+@dataclass
+class ProblematicEntries:
+    """Flagged requests stored column-wise; index i across all columns is one entry."""
+    line: array = field(default_factory=lambda: array("i"))
+    ip: list = field(default_factory=list)
+    method: list = field(default_factory=list)
+    path: list = field(default_factory=list)
+    status: array = field(default_factory=lambda: array("i"))
+    # Same widths as analyse_chunk's int32 response time and int64 bytes
+    # sent columns; parse_log_line rejects values that do not fit
+    response_time: array = field(default_factory=lambda: array("i"))
+    bytes_sent: array = field(default_factory=lambda: array("q"))
+    issues: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.line)
+
+    def rows(self):
+        """Iterate over entries as (line, ip, method, path, status, response_time, bytes_sent, issues)."""
+        return zip(self.line, self.ip, self.method, self.path, self.status,
+                   self.response_time, self.bytes_sent, self.issues)
+
+
+@dataclass
+class ChunkResult:
+    """Partial aggregates for the lines starting inside one byte range of the log."""
+    total_lines: int
+    malformed_lines: int
+    response_times: np.ndarray
+    suspicious_paths: Counter
+    ip_addresses: Counter
+    malformed_ips: Counter
+    http_methods: Counter
+    bot_stats: dict
+    bot_types: Counter
+    # One element per parsed line, aligned with response_times;
+    # line numbers are relative to the start of the chunk
+    line_numbers: np.ndarray
+    ips: list
+    methods: list
+    paths: list
+    statuses: np.ndarray
+    bytes_sent: np.ndarray
+    issue_flags: np.ndarray
+
+
 @dataclass
 class AnalysisResult:
     total_lines: int
     problem_lines: int
     problem_counts: Counter
     status_codes: Counter
-    response_times: list
+    response_times: np.ndarray
     suspicious_paths: Counter
     ip_addresses: Counter
     http_methods: Counter
     bot_stats: dict
     bot_types: Counter
-    problematic_entries: list
+    high_request_ips: set
+    problematic_entries: ProblematicEntries
+
+
+@dataclass
+class ResponseTimeStats:
+    bin_edges: np.ndarray
+    bin_counts: np.ndarray
+    slow_count: int
+    p50: float
+    p95: float
+
+
+@dataclass
+class DashboardData:
+    """Small precomputed aggregates; everything the dashboard needs to draw."""
+    total_lines: int
+    top_issues: list
+    status_groups: dict
+    rt_stats: Optional[ResponseTimeStats]
+    top_paths: list
+    top_ips: list
+    http_methods: list
+    total_bots: int
+    high_request_bots: int
+    top_bot_types: list
+    bot_status_codes: list
 
 
 # ---------------------------------------------------------------------------
@@ -123,23 +263,31 @@ def download_log_file() -> bool:
     if os.path.exists(LOCAL_LOG_FILE):
         return True
 
+    import requests
+
     log.info("Downloading log file from GitHub...")
+    # Stream into a temporary file so an aborted download never leaves a
+    # truncated LOCAL_LOG_FILE behind to be picked up by the next run.
+    partial_file = LOCAL_LOG_FILE + ".part"
     try:
         with requests.get(GITHUB_LOG_URL, stream=True, timeout=DOWNLOAD_TIMEOUT_S) as response:
             response.raise_for_status()
-            with open(LOCAL_LOG_FILE, "wb") as f:
+            with open(partial_file, "wb") as f:
                 downloaded = 0
-                for chunk in response.iter_content(chunk_size=65_536):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
                     f.write(chunk)
                     downloaded += len(chunk)
                     if downloaded > MAX_DOWNLOAD_BYTES:
                         raise ValueError(
                             f"Log file exceeds the {MAX_DOWNLOAD_BYTES // (1024 * 1024)} MB size limit."
                         )
+        os.replace(partial_file, LOCAL_LOG_FILE)
         log.info("Download complete: %s", LOCAL_LOG_FILE)
         return True
     except Exception as exc:
         log.error("Failed to download log file: %s", exc)
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
         return False
 
 
@@ -186,196 +334,581 @@ def extract_bot_name(user_agent: str) -> str:
         return "Baiduspider"
     if "yandex" in ua_lower:
         return "YandexBot"
-    bot_match = re.search(r'(\w+bot/[\d.]+|\w+bot)', user_agent, re.IGNORECASE)
+    bot_match = BOT_NAME_RE.search(user_agent)
     if bot_match:
         return bot_match.group(1)
     return "Unknown Bot"
 
 
+@lru_cache(maxsize=4096)
+def classify_ua(user_agent: str) -> tuple:
+    """
+    Cached bot classification for a user agent string.
+
+    Logs contain relatively few distinct user agents repeated many times,
+    so the regex work in is_bot and extract_bot_name is done once per
+    distinct string.
+
+    Args:
+        user_agent: The User-Agent header string.
+
+    Returns:
+        (is_bot, bot_name), where bot_name is None for non-bots.
+    """
+    if not is_bot(user_agent):
+        return False, None
+    return True, extract_bot_name(user_agent)
+
+
 # ---------------------------------------------------------------------------
 # Log line parsing
 # ---------------------------------------------------------------------------
 
-def parse_log_line(line: str) -> Optional[LogEntry]:
+def split_log_line(line: bytes) -> Optional[tuple]:
     """
-    Parse a single log line into a LogEntry dataclass.
+    Split a log line into its 11 fields using plain bytes operations.
+
+    This is the fast path for well-formed lines: splitting on the double
+    quotes yields the prefix, request, status/size, referer, user agent
+    and response time segments without running the regex engine. Any line
+    that does not have exactly that shape is rejected so the caller can
+    fall back to LOG_RE.
 
     Args:
-        line: A raw log line string.
+        line: A raw log line, including its line ending.
 
     Returns:
-        A LogEntry on success, or None if the line is malformed.
+        The same 11-tuple LOG_RE.fullmatch(...).groups() would produce, or None.
     """
-    match = LOG_PATTERN.match(line.strip())
-    if not match:
+    parts = line.split(b'"')
+    if len(parts) != 7 or parts[4] != b" ":
         return None
 
-    ip, auth, timestamp, method, path, protocol, status, bytes_sent, referer, user_agent, response_time = match.groups()
+    prefix, request, codes, referer, _, user_agent, tail = parts
+
+    # Tabs and other non-space whitespace would be accepted by split(b" ")
+    # but not by the \S+ groups; leave those lines to the regex.
+    if OTHER_WHITESPACE_RE.search(prefix) or OTHER_WHITESPACE_RE.search(request):
+        return None
+
+    # 'ip - auth - [timestamp] '
+    head = prefix.split(b" ", 4)
+    if len(head) != 5 or head[1] != b"-" or head[3] != b"-":
+        return None
+    ip, _, auth, _, timestamp = head
+    if not ip or not auth or timestamp[:1] != b"[" or timestamp[-2:] != b"] ":
+        return None
+
+    # 'METHOD PATH PROTOCOL'
+    request_parts = request.split(b" ")
+    if len(request_parts) != 3 or not all(request_parts):
+        return None
+    method, path, protocol = request_parts
+
+    # ' STATUS BYTES '
+    code_parts = codes.split(b" ")
+    if len(code_parts) != 4 or code_parts[0] or code_parts[3]:
+        return None
+    status, bytes_sent = code_parts[1], code_parts[2]
+    if len(status) != 3 or not status.isdigit() or not bytes_sent.isdigit():
+        return None
+
+    # ' RESPONSE_TIME\n'
+    response_time = tail[1:].rstrip()
+    if tail[:1] != b" " or not response_time.isdigit():
+        return None
+
+    return (
+        ip, auth, timestamp[1:-2], method, path, protocol,
+        status, bytes_sent, referer, user_agent, response_time,
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def decode_field(raw: bytes) -> str:
+    """
+    Decode a repeated log field, returning one shared str per distinct value.
+
+    IPs, methods, paths and user agents repeat heavily, so caching the
+    decode both skips the work and makes every Counter and column share
+    the same string object for equal values.
+
+    Args:
+        raw: The field's raw bytes.
+
+    Returns:
+        The field decoded as UTF-8 (invalid bytes replaced).
+    """
+    return raw.decode("utf-8", "replace")
+
+
+def parse_log_line(line: bytes) -> Optional[LogEntry]:
+    """
+    Parse a single raw log line into a LogEntry dataclass.
+
+    Well-formed lines go through split_log_line; anything it rejects is
+    retried against LOG_RE so unusual but valid lines still parse. Only
+    the captured text fields are decoded, repeated ones via decode_field;
+    numeric fields are converted straight from bytes.
+
+    Numeric values too large for the result columns are treated as
+    malformed rather than overflowing later in analyse_chunk.
+
+    Args:
+        line: A raw log line as read from a binary file.
+
+    Returns:
+        A LogEntry on success, or None if the line is malformed.
+    """
+    fields = split_log_line(line)
+    if fields is None:
+        match = LOG_RE.fullmatch(line)
+        if not match:
+            return None
+        fields = match.groups()
+
+    ip, auth, timestamp, method, path, protocol, status, bytes_sent, referer, user_agent, response_time = fields
 
     try:
-        return LogEntry(
-            ip=ip,
-            auth=auth,
-            timestamp=timestamp,
-            method=method,
-            path=path,
-            protocol=protocol,
-            status=int(status),
-            bytes_sent=int(bytes_sent),
-            referer=referer,
-            user_agent=user_agent,
-            response_time=int(response_time),
-        )
+        status = int(status)
+        bytes_sent = int(bytes_sent)
+        response_time = int(response_time)
     except ValueError:
         return None
+    if response_time > MAX_RESPONSE_TIME_MS or bytes_sent > MAX_BYTES_SENT:
+        return None
+
+    return LogEntry(
+        ip=decode_field(ip),
+        auth=decode_field(auth),
+        timestamp=timestamp.decode("utf-8", "replace"),
+        method=decode_field(method),
+        path=decode_field(path),
+        protocol=decode_field(protocol),
+        status=status,
+        bytes_sent=bytes_sent,
+        referer=decode_field(referer),
+        user_agent=decode_field(user_agent),
+        response_time=response_time,
+    )
 
 
-def detect_issues(entry: LogEntry, high_request_ips: set) -> list:
+@lru_cache(maxsize=4096)
+def is_valid_timestamp(timestamp: str) -> bool:
     """
-    Return a list of issue strings for a parsed log entry.
+    Check a timestamp against the dd/mm/YYYY:HH:MM:SS log format.
+
+    Replaces datetime.strptime, whose result was only ever used to catch
+    ValueError. Fields must be zero-padded as the log writes them; the
+    ranges match what strptime/datetime accept, including the number of
+    days in the month and leap years. Log lines are written in time order,
+    so a small cache catches the many lines sharing a recent timestamp.
 
     Args:
-        entry:            A parsed LogEntry.
-        high_request_ips: Set of IPs that have exceeded the request threshold.
+        timestamp: The timestamp text between the square brackets.
 
     Returns:
-        A list of issue description strings (may be empty).
+        True if the timestamp is well formed and names a real date/time.
     """
-    issues = []
+    match = TS_RE.fullmatch(timestamp)
+    if not match:
+        return False
 
-    if entry.ip in high_request_ips:
-        issues.append("High request count (potential bot)")
+    day, month, year, hour, minute, second = map(int, match.groups())
+    if year < 1 or not 1 <= month <= 12 or hour > 23 or minute > 59 or second > 59:
+        return False
+    return 1 <= day <= calendar.monthrange(year, month)[1]
+
+
+@lru_cache(maxsize=1 << 16)
+def is_suspicious_path(path: str) -> bool:
+    """
+    Cached check of a request path against SUSPICIOUS_PATH_RE.
+
+    Paths repeat across many lines, so the regex search runs once per
+    distinct path and later lines are a single cache lookup.
+
+    Args:
+        path: The request path.
+
+    Returns:
+        True if the path looks like a probe of a sensitive endpoint.
+    """
+    return SUSPICIOUS_PATH_RE.search(path) is not None
+
+
+def text_issue_flags(entry: LogEntry, bot_detected: bool, suspicious_path: bool) -> int:
+    """
+    Return the issue flags that depend on an entry's text fields.
+
+    Numeric thresholds are applied to whole columns by classify_columns,
+    and the high-request flag needs per-IP totals for the whole file, so
+    both are added later.
 
-    if is_bot(entry.user_agent):
-        issues.append("Bot detected")
+    Args:
+        entry:           A parsed LogEntry.
+        bot_detected:    Whether the entry's user agent was classified as a bot.
+        suspicious_path: Whether is_suspicious_path flagged the entry's path.
 
-    if 400 <= entry.status < 500:
-        issues.append(f"Client error ({entry.status})")
-    elif 500 <= entry.status < 600:
-        issues.append(f"Server error ({entry.status})")
+    Returns:
+        A bitmask of FLAG_* values (0 if none apply).
+    """
+    flags = 0
 
-    if entry.response_time > SLOW_RESPONSE_MS:
-        issues.append("Slow response (>500ms)")
+    if bot_detected:
+        flags |= FLAG_BOT
 
     if entry.user_agent in ("-", ""):
-        issues.append("Missing user agent")
+        flags |= FLAG_MISSING_UA
 
-    if SUSPICIOUS_PATH_RE.search(entry.path):
-        issues.append("Suspicious path")
+    if suspicious_path:
+        flags |= FLAG_SUSP_PATH
 
     if entry.auth == "NO":
-        issues.append("Authentication failed")
+        flags |= FLAG_AUTH_FAIL
+
+    if not is_valid_timestamp(entry.timestamp):
+        flags |= FLAG_BAD_TS
+
+    return flags
 
-    try:
-        datetime.strptime(entry.timestamp, "%d/%m/%Y:%H:%M:%S")
-    except ValueError:
-        issues.append("Invalid timestamp")
 
-    if entry.bytes_sent > LARGE_TRANSFER_BYTES:
-        issues.append("Large transfer (>1MB)")
+def classify_columns(statuses: np.ndarray, response_times: np.ndarray,
+                     bytes_sent: np.ndarray, issue_flags: np.ndarray) -> np.ndarray:
+    """
+    Add the numeric issue flags to a column of per-line text flags.
+
+    Each threshold is one vectorised comparison over the whole column
+    rather than a Python-level check per line.
+
+    Args:
+        statuses:       HTTP status code per line.
+        response_times: Response time in milliseconds per line.
+        bytes_sent:     Response size in bytes per line.
+        issue_flags:    Flags from text_issue_flags per line.
+
+    Returns:
+        A new array of combined FLAG_* bitmasks.
+    """
+    flags = issue_flags.copy()
+    flags[(statuses >= 400) & (statuses < 600)] |= FLAG_HTTP_ERROR
+    flags[response_times > SLOW_RESPONSE_MS] |= FLAG_SLOW
+    flags[bytes_sent > LARGE_TRANSFER_BYTES] |= FLAG_LARGE
+    return flags
 
-    return issues
+
+def http_error_message(status: int) -> str:
+    """Return the client/server error issue message for a 4xx/5xx status."""
+    return CLIENT_ERR_MSG.get(status) or SERVER_ERR_MSG[status]
+
+
+@lru_cache(maxsize=None)
+def issues_for_flags(flags: int, status: int) -> tuple:
+    """
+    Expand an issue bitmask into its messages, in ISSUE_FLAGS order.
+
+    Args:
+        flags:  A combined FLAG_* bitmask.
+        status: The entry's HTTP status code.
+
+    Returns:
+        A tuple of issue description strings.
+    """
+    issues = []
+    for flag, message in ISSUE_FLAGS:
+        if flags & flag:
+            issues.append(message if message is not None else http_error_message(status))
+    return tuple(issues)
 
 
 # ---------------------------------------------------------------------------
 # Analysis
 # ---------------------------------------------------------------------------
 
-def collect_ip_counts(filepath: str) -> Counter:
+def next_line_start(mm: mmap.mmap, pos: int) -> int:
+    """Return pos if a line starts there, otherwise the start of the following line."""
+    if pos == 0:
+        return 0
+    newline = mm.find(b"\n", pos - 1)
+    return newline + 1 if newline != -1 else len(mm)
+
+
+def iter_line_blocks(filepath: str, start: int, end: int):
     """
-    Single-pass collection of per-IP request counts.
+    Yield the lines starting within [start, end) of a file in large batches.
+
+    The file is memory-mapped and split into lines READ_BLOCK_BYTES at a
+    time with bytes.split, so line splitting happens in C rather than one
+    readline per line. A range that begins mid-line skips to the next line,
+    and the line crossing `end` is finished, matching the neighbouring
+    range's start.
 
     Args:
         filepath: Path to the log file.
+        start:    Byte offset where the range begins.
+        end:      Byte offset where the range ends.
 
-    Returns:
-        A Counter mapping IP address to request count.
+    Yields:
+        Lists of raw lines without their trailing b"\n".
     """
-    ip_re = re.compile(r'^(\S+) -')
-    counts = Counter()
-    with open(filepath, "r", encoding="utf-8", errors="replace") as fh:
-        for line in fh:
-            m = ip_re.match(line)
-            if m:
-                counts[m.group(1)] += 1
-    return counts
-
-
-def analyse_entries(filepath: str, high_request_ips: set) -> AnalysisResult:
+    with open(filepath, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = next_line_start(mm, min(start, len(mm)))
+            stop = next_line_start(mm, min(end, len(mm)))
+            while pos < stop:
+                block_end = min(pos + READ_BLOCK_BYTES, stop)
+                if block_end < stop:
+                    block_end = next_line_start(mm, block_end)
+                block = mm[pos:block_end]
+                lines = block.split(b"\n")
+                if block.endswith(b"\n"):
+                    lines.pop()
+                yield lines
+                pos = block_end
+
+
+def analyse_chunk(filepath: str, start: int, end: int) -> ChunkResult:
     """
-    Full analysis pass over the log file.
+    Parse every line that starts within [start, end) of the log file.
+
+    Lines come from iter_line_blocks, so a line crossing a chunk boundary
+    is handled exactly once, by the chunk it starts in. The fields needed
+    for the report are kept as per-line columns because the high-request
+    flag needs per-IP totals for the whole file.
 
     Args:
-        filepath:         Path to the log file.
-        high_request_ips: Pre-computed set of high-volume IPs.
+        filepath: Path to the log file.
+        start:    Byte offset where the chunk begins.
+        end:      Byte offset where the chunk ends.
 
     Returns:
-        A populated AnalysisResult dataclass.
+        A ChunkResult with this chunk's aggregates and per-line columns.
     """
     total_lines = 0
-    problem_lines = 0
-    problem_counts = Counter()
-    status_codes = Counter()
-    response_times = []
-    suspicious_paths = Counter()
-    ip_addresses = Counter()
-    http_methods = Counter()
+    malformed_lines = 0
+    # Over-estimate the line count so the buffer rarely has to grow
+    response_times = np.empty(
+        max(1024, (end - start) // MIN_LINE_BYTES_ESTIMATE), dtype=np.int32
+    )
+    rt_count = 0
+    # Per-line increments go into defaultdicts, which are cheaper to
+    # increment than Counter; they are converted to Counters at the end.
+    suspicious_paths = defaultdict(int)
+    ip_addresses = defaultdict(int)
+    malformed_ips = defaultdict(int)
+    http_methods = defaultdict(int)
     bot_stats = {
         "total_bots": 0,
-        "bot_ips": Counter(),
-        "bot_paths": Counter(),
-        "bot_status_codes": Counter(),
-        "high_request_bots": 0,
+        "bot_ips": defaultdict(int),
+        "bot_paths": defaultdict(int),
     }
-    bot_types = Counter()
-    problematic_entries = []
-
-    with open(filepath, "r", encoding="utf-8", errors="replace") as fh:
-        for line_number, line in enumerate(fh, 1):
+    bot_types = defaultdict(int)
+    line_numbers = array("i")
+    ips = []
+    methods = []
+    paths = []
+    # Status codes are tallied by analyse_entries, which counts the merged
+    # statuses column in one pass
+    statuses = array("i")
+    bytes_sent = array("q")
+    issue_flags = array("H")
+
+    for lines in iter_line_blocks(filepath, start, end):
+        for line in lines:
             total_lines += 1
 
             entry = parse_log_line(line)
             if entry is None:
-                problem_lines += 1
-                problem_counts["Malformed log entry"] += 1
+                malformed_lines += 1
+                # Malformed lines still count towards their IP's request total
+                m = IP_PREFIX_RE.match(line)
+                if m:
+                    malformed_ips[m.group(1).decode("utf-8", "replace")] += 1
                 continue
 
             ip_addresses[entry.ip] += 1
-            status_codes[entry.status] += 1
-            response_times.append(entry.response_time)
+            if rt_count == response_times.size:
+                response_times.resize(rt_count * 2, refcheck=False)
+            response_times[rt_count] = entry.response_time
+            rt_count += 1
             http_methods[entry.method] += 1
 
-            bot_detected = is_bot(entry.user_agent)
-            is_high_req = entry.ip in high_request_ips
+            bot_detected, bot_name = classify_ua(entry.user_agent)
 
             if bot_detected:
                 bot_stats["total_bots"] += 1
                 bot_stats["bot_ips"][entry.ip] += 1
                 bot_stats["bot_paths"][entry.path] += 1
-                bot_stats["bot_status_codes"][entry.status] += 1
-                bot_types[extract_bot_name(entry.user_agent)] += 1
-
-            if is_high_req and not bot_detected:
-                bot_stats["high_request_bots"] += 1
+                bot_types[bot_name] += 1
 
-            if SUSPICIOUS_PATH_RE.search(entry.path):
+            suspicious_path = is_suspicious_path(entry.path)
+            if suspicious_path:
                 suspicious_paths[entry.path] += 1
 
-            issues = detect_issues(entry, high_request_ips)
-
-            if issues:
-                problem_lines += 1
-                problem_counts.update(issues)
-                problematic_entries.append({
-                    "line": line_number,
-                    "ip": entry.ip,
-                    "method": entry.method,
-                    "path": entry.path,
-                    "status": entry.status,
-                    "response_time": entry.response_time,
-                    "bytes": entry.bytes_sent,
-                    "issues": list(set(issues)),
-                })
+            line_numbers.append(total_lines)
+            ips.append(entry.ip)
+            methods.append(entry.method)
+            paths.append(entry.path)
+            statuses.append(entry.status)
+            bytes_sent.append(entry.bytes_sent)
+            issue_flags.append(text_issue_flags(entry, bot_detected, suspicious_path))
+
+    response_times.resize(rt_count, refcheck=False)
+    statuses = np.frombuffer(statuses, dtype=np.intc)
+    bytes_sent = np.frombuffer(bytes_sent, dtype=np.longlong)
+    for key in ("bot_ips", "bot_paths"):
+        bot_stats[key] = Counter(bot_stats[key])
+
+    return ChunkResult(
+        total_lines=total_lines,
+        malformed_lines=malformed_lines,
+        response_times=response_times,
+        suspicious_paths=Counter(suspicious_paths),
+        ip_addresses=Counter(ip_addresses),
+        malformed_ips=Counter(malformed_ips),
+        http_methods=Counter(http_methods),
+        bot_stats=bot_stats,
+        bot_types=Counter(bot_types),
+        line_numbers=np.frombuffer(line_numbers, dtype=np.intc),
+        ips=ips,
+        methods=methods,
+        paths=paths,
+        statuses=statuses,
+        bytes_sent=bytes_sent,
+        issue_flags=classify_columns(
+            statuses, response_times, bytes_sent, np.frombuffer(issue_flags, dtype=np.ushort)
+        ),
+    )
+
+
+def count_values(values: np.ndarray) -> Counter:
+    """
+    Tally a column of small non-negative integers such as status codes.
+
+    np.bincount does the counting in a single C-level pass; only the
+    values that actually occur are copied into the Counter, in ascending
+    order.
+
+    Args:
+        values: Integer column to count.
+
+    Returns:
+        A Counter mapping each value present to its number of occurrences.
+    """
+    counts = np.bincount(values)
+    present = np.flatnonzero(counts)
+    return Counter(dict(zip(present.tolist(), counts[present].tolist())))
+
+
+def analyse_entries(filepath: str, workers: int = ANALYSIS_WORKERS) -> AnalysisResult:
+    """
+    Analyse the log file in parallel byte-range chunks, then flag high-request IPs.
+
+    The file is split into one chunk per worker and each chunk is parsed
+    by analyse_chunk in its own process. The partial Counters and arrays
+    are merged here, and once per-IP totals are known the high-request
+    flag is added to the per-line issue flags in a final vectorised pass
+    over the merged columns. Files smaller than MIN_CHUNK_BYTES per worker
+    use fewer workers, down to a single in-process chunk.
+
+    Args:
+        filepath: Path to the log file.
+        workers:  Maximum number of worker processes.
+
+    Returns:
+        A populated AnalysisResult dataclass.
+    """
+    size = os.path.getsize(filepath)
+    workers = max(1, min(workers, size // MIN_CHUNK_BYTES))
+    bounds = [(filepath, i * size // workers, (i + 1) * size // workers) for i in range(workers)]
+
+    if workers == 1:
+        chunks = [analyse_chunk(*bounds[0])]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            chunks = pool.starmap(analyse_chunk, bounds)
+
+    total_lines = 0
+    problem_lines = 0
+    problem_counts = Counter()
+    suspicious_paths = Counter()
+    ip_addresses = Counter()
+    malformed_ips = Counter()
+    http_methods = Counter()
+    bot_stats = {
+        "total_bots": 0,
+        "bot_ips": Counter(),
+        "bot_paths": Counter(),
+        "high_request_bots": 0,
+    }
+    bot_types = Counter()
+
+    line_offset = 0
+    line_numbers = []
+    for chunk in chunks:
+        total_lines += chunk.total_lines
+        if chunk.malformed_lines:
+            problem_lines += chunk.malformed_lines
+            problem_counts[MSG_MALFORMED] += chunk.malformed_lines
+        suspicious_paths.update(chunk.suspicious_paths)
+        ip_addresses.update(chunk.ip_addresses)
+        malformed_ips.update(chunk.malformed_ips)
+        http_methods.update(chunk.http_methods)
+        bot_stats["total_bots"] += chunk.bot_stats["total_bots"]
+        for key in ("bot_ips", "bot_paths"):
+            bot_stats[key].update(chunk.bot_stats[key])
+        bot_types.update(chunk.bot_types)
+        line_numbers.append(chunk.line_numbers + line_offset)
+        line_offset += chunk.total_lines
+
+    line_numbers = np.concatenate(line_numbers)
+    response_times = np.concatenate([chunk.response_times for chunk in chunks])
+    statuses = np.concatenate([chunk.statuses for chunk in chunks])
+    bytes_sent = np.concatenate([chunk.bytes_sent for chunk in chunks])
+    issue_flags = np.concatenate([chunk.issue_flags for chunk in chunks])
+    ips = [ip for chunk in chunks for ip in chunk.ips]
+
+    status_codes = count_values(statuses)
+    bot_stats["bot_status_codes"] = count_values(statuses[(issue_flags & FLAG_BOT) != 0])
+
+    request_counts = ip_addresses + malformed_ips
+    high_request_ips = {ip for ip, count in request_counts.items() if count > HIGH_REQUEST_THRESHOLD}
+
+    is_high = np.fromiter((ip in high_request_ips for ip in ips), dtype=bool, count=len(ips))
+    issue_flags[is_high] |= FLAG_HIGH_REQ
+    bot_stats["high_request_bots"] = int(np.count_nonzero(is_high & ((issue_flags & FLAG_BOT) == 0)))
+
+    flagged = issue_flags != 0
+    problem_lines += int(np.count_nonzero(flagged))
+    for flag, message in ISSUE_FLAGS:
+        has_flag = (issue_flags & flag) != 0
+        if message is None:
+            for code, count in count_values(statuses[has_flag]).items():
+                problem_counts[http_error_message(code)] = count
+        else:
+            count = int(np.count_nonzero(has_flag))
+            if count:
+                problem_counts[message] = count
+
+    rows = np.flatnonzero(flagged)
+    row_list = rows.tolist()
+    methods = [m for chunk in chunks for m in chunk.methods]
+    paths = [p for chunk in chunks for p in chunk.paths]
+    problematic_entries = ProblematicEntries(
+        line=array("i", line_numbers[rows].tolist()),
+        ip=[ips[i] for i in row_list],
+        method=[methods[i] for i in row_list],
+        path=[paths[i] for i in row_list],
+        status=array("i", statuses[rows].tolist()),
+        response_time=array("i", response_times[rows].tolist()),
+        bytes_sent=array("q", bytes_sent[rows].tolist()),
+        issues=[
+            issues_for_flags(flags, status)
+            for flags, status in zip(issue_flags[rows].tolist(), statuses[rows].tolist())
+        ],
+    )
 
     return AnalysisResult(
         total_lines=total_lines,
@@ -388,20 +921,50 @@ def analyse_entries(filepath: str, high_request_ips: set) -> AnalysisResult:
         http_methods=http_methods,
         bot_stats=bot_stats,
         bot_types=bot_types,
+        high_request_ips=high_request_ips,
         problematic_entries=problematic_entries,
     )
 
 
+def response_time_stats(response_times: np.ndarray) -> Optional[ResponseTimeStats]:
+    """
+    Summarise response times with vectorised NumPy reductions.
+
+    Computes the histogram used by the dashboard together with the slow
+    response count and median/95th percentile, so neither the report nor
+    matplotlib has to walk the raw values again.
+
+    Args:
+        response_times: Array of response times in milliseconds.
+
+    Returns:
+        A ResponseTimeStats, or None if there are no response times.
+    """
+    if response_times.size == 0:
+        return None
+
+    bin_counts, bin_edges = np.histogram(response_times, bins=RESPONSE_TIME_BINS)
+    p50, p95 = np.percentile(response_times, [50, 95])
+    return ResponseTimeStats(
+        bin_edges=bin_edges,
+        bin_counts=bin_counts,
+        slow_count=int(np.count_nonzero(response_times > SLOW_RESPONSE_MS)),
+        p50=float(p50),
+        p95=float(p95),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Reporting
 # ---------------------------------------------------------------------------
 
-def print_report(result: AnalysisResult) -> None:
+def print_report(result: AnalysisResult, rt_stats: Optional[ResponseTimeStats]) -> None:
     """
     Print a summary of the analysis results.
 
     Args:
-        result: A completed AnalysisResult.
+        result:   A completed AnalysisResult.
+        rt_stats: Response time summary, or None if there were no entries.
     """
     t = result.total_lines
     b = result.bot_stats
@@ -415,6 +978,10 @@ def print_report(result: AnalysisResult) -> None:
         log.info("  High-request IPs      : %d (%.2f%%)", b["high_request_bots"], b["high_request_bots"] / t * 100)
         log.info("  Percentage problematic: %.2f%%", result.problem_lines / t * 100)
 
+    if rt_stats is not None:
+        log.info("  Response time p50/p95 : %.0f / %.0f ms", rt_stats.p50, rt_stats.p95)
+        log.info("  Slow responses        : %d", rt_stats.slow_count)
+
     if result.problem_counts:
         log.info("Top issues:")
         for issue, count in result.problem_counts.most_common(10):
@@ -458,25 +1025,27 @@ def save_problematic_report(result: AnalysisResult) -> None:
 
     log.info("Problematic HTTP requests (first 10):")
     log.info(header.rstrip())
-    for entry in entries[:10]:
+    for line, ip, method, path, status, response_time, bytes_sent, issues in islice(entries.rows(), 10):
         log.info(
             "%4d | %-17s | %-6s | %-20s | %-6d | %-8d | %-6d | %s",
-            entry["line"], entry["ip"], entry["method"],
-            entry["path"][:20], entry["status"],
-            entry["response_time"], entry["bytes"],
-            ", ".join(entry["issues"][:2]),
+            line, ip, method, path[:20], status,
+            response_time, bytes_sent, ", ".join(issues[:2]),
         )
 
-    with open(out_path, "w", encoding="utf-8") as f:
+    # Rows are formatted lazily and streamed through the write buffer, so
+    # the report text is never held in memory all at once
+    rows = (
+        f"{line:<4} | {ip:<17} | {method:<6} | "
+        f"{path[:20]:<20} | {status:<6} | "
+        f"{response_time:<8} | {bytes_sent:<6} | "
+        f"{', '.join(issues)}\n"
+        for line, ip, method, path, status, response_time, bytes_sent, issues in entries.rows()
+    )
+
+    with open(out_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
         f.write("Full List of Problematic Requests:\n")
         f.write(header)
-        for entry in entries:
-            f.write(
-                f"{entry['line']:<4} | {entry['ip']:<17} | {entry['method']:<6} | "
-                f"{entry['path'][:20]:<20} | {entry['status']:<6} | "
-                f"{entry['response_time']:<8} | {entry['bytes']:<6} | "
-                f"{', '.join(entry['issues'])}\n"
-            )
+        f.writelines(rows)
 
     log.info("Saved full report of %d entries to '%s'", len(entries), out_path)
 
@@ -485,27 +1054,70 @@ def save_problematic_report(result: AnalysisResult) -> None:
 # Visualisation
 # ---------------------------------------------------------------------------
 
-def visualize_data(result: AnalysisResult) -> None:
+def build_dashboard_data(result: AnalysisResult, rt_stats: Optional[ResponseTimeStats]) -> DashboardData:
+    """
+    Reduce the analysis results to the handful of values each chart plots.
+
+    Args:
+        result:   A completed AnalysisResult.
+        rt_stats: Response time summary, or None if there were no entries.
+
+    Returns:
+        A DashboardData whose fields are at most a few dozen items long.
+    """
+    status_groups = {}
+    if result.status_codes:
+        codes = np.fromiter(result.status_codes.keys(), dtype=np.int32, count=len(result.status_codes))
+        # Dense per-code counts, so each group total is one slice sum
+        by_code = np.zeros(max(600, int(codes.max()) + 1), dtype=np.int64)
+        by_code[codes] = np.fromiter(result.status_codes.values(), dtype=np.int64, count=len(codes))
+        status_groups = {
+            "2xx Success":    int(by_code[200:300].sum()),
+            "3xx Redirect":   int(by_code[300:400].sum()),
+            "4xx Client err": int(by_code[400:500].sum()),
+            "5xx Server err": int(by_code[500:600].sum()),
+            "Other":          int(by_code[:200].sum() + by_code[600:].sum()),
+        }
+
+    bot_stats = result.bot_stats
+    return DashboardData(
+        total_lines=result.total_lines,
+        top_issues=result.problem_counts.most_common(8),
+        status_groups=status_groups,
+        rt_stats=rt_stats,
+        top_paths=result.suspicious_paths.most_common(8),
+        top_ips=result.ip_addresses.most_common(8),
+        http_methods=list(result.http_methods.items()),
+        total_bots=bot_stats["total_bots"],
+        high_request_bots=bot_stats["high_request_bots"],
+        top_bot_types=result.bot_types.most_common(8),
+        bot_status_codes=sorted(bot_stats["bot_status_codes"].items()),
+    )
+
+
+def visualize_data(data: DashboardData) -> None:
     """
     Generate and save a 3x3 visualisation dashboard as a PNG into OUTPUT_DIR.
 
     Args:
-        result: A completed AnalysisResult.
+        data: Precomputed aggregates from build_dashboard_data.
     """
+    import matplotlib
+    matplotlib.use("Agg")  # Non-interactive backend — must be set before importing pyplot
+    import matplotlib.pyplot as plt
+
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     out_path = os.path.join(OUTPUT_DIR, "log_analysis_report.png")
 
-    t = result.total_lines
-    bot_stats = result.bot_stats
+    t = data.total_lines
 
     fig, axes = plt.subplots(3, 3, figsize=(18, 15))
     fig.suptitle(f"Log Analysis Summary ({t} entries)", fontsize=16)
 
     # 1. Problem type distribution
     ax = axes[0, 0]
-    if result.problem_counts:
-        items = sorted(result.problem_counts.items(), key=lambda x: x[1], reverse=True)[:8]
-        problems, counts = zip(*items)
+    if data.top_issues:
+        problems, counts = zip(*data.top_issues)
         ax.bar(problems, counts, color="salmon")
         ax.set_title("Top 8 issues detected")
         ax.set_ylabel("Count")
@@ -517,16 +1129,9 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 2. Status code distribution
     ax = axes[0, 1]
-    if result.status_codes:
-        status_groups = {
-            "2xx Success":    sum(c for code, c in result.status_codes.items() if 200 <= code < 300),
-            "3xx Redirect":   sum(c for code, c in result.status_codes.items() if 300 <= code < 400),
-            "4xx Client err": sum(c for code, c in result.status_codes.items() if 400 <= code < 500),
-            "5xx Server err": sum(c for code, c in result.status_codes.items() if 500 <= code < 600),
-            "Other":          sum(c for code, c in result.status_codes.items() if code < 200 or code >= 600),
-        }
+    if data.status_groups:
         # Only pass non-zero slices to avoid explode length mismatch
-        non_zero = {k: v for k, v in status_groups.items() if v > 0}
+        non_zero = {k: v for k, v in data.status_groups.items() if v > 0}
         colors = ["#4CAF50", "#FFC107", "#FF9800", "#F44336", "#9E9E9E"][:len(non_zero)]
         explode = [0.05] * len(non_zero)
         ax.pie(
@@ -542,8 +1147,11 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 3. Response time distribution
     ax = axes[0, 2]
-    if result.response_times:
-        ax.hist(result.response_times, bins=50, color="#2196F3", edgecolor="black")
+    rt_stats = data.rt_stats
+    if rt_stats is not None:
+        # One filled step artist instead of a Rectangle per bin; a filled
+        # StepPatch has no per-bin outlines
+        ax.stairs(rt_stats.bin_counts, rt_stats.bin_edges, fill=True, color="#2196F3")
         ax.set_title("Response time distribution")
         ax.set_xlabel("Response time (ms)")
         ax.set_ylabel("Frequency")
@@ -557,8 +1165,8 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 4. Suspicious paths
     ax = axes[1, 0]
-    if result.suspicious_paths:
-        paths, counts = zip(*result.suspicious_paths.most_common(8))
+    if data.top_paths:
+        paths, counts = zip(*data.top_paths)
         ax.barh(paths, counts, color="#FF5722")
         ax.set_title("Top suspicious paths")
         ax.set_xlabel("Access count")
@@ -569,8 +1177,8 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 5. Top IP addresses
     ax = axes[1, 1]
-    if result.ip_addresses:
-        ips, counts = zip(*result.ip_addresses.most_common(8))
+    if data.top_ips:
+        ips, counts = zip(*data.top_ips)
         ax.barh(ips, counts, color="#9C27B0")
         ax.set_title("Top client IP addresses")
         ax.set_xlabel("Request count")
@@ -581,8 +1189,8 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 6. HTTP methods
     ax = axes[1, 2]
-    if result.http_methods:
-        methods, counts = zip(*result.http_methods.items())
+    if data.http_methods:
+        methods, counts = zip(*data.http_methods)
         ax.pie(counts, labels=methods, autopct="%1.1f%%",
                startangle=90, colors=plt.cm.Pastel1.colors)
         ax.set_title("HTTP method distribution")
@@ -593,9 +1201,9 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 7. Traffic composition
     ax = axes[2, 0]
-    human_traffic = t - bot_stats["total_bots"] - bot_stats["high_request_bots"]
+    human_traffic = t - data.total_bots - data.high_request_bots
     if human_traffic < t:
-        sizes = [human_traffic, bot_stats["total_bots"], bot_stats["high_request_bots"]]
+        sizes = [human_traffic, data.total_bots, data.high_request_bots]
         labels = ["Human traffic", "Known bots", "High-request IPs"]
         ax.pie(sizes, explode=(0.1, 0, 0.1), labels=labels,
                colors=["#66b3ff", "#ff9999", "#ffcc99"],
@@ -608,8 +1216,8 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 8. Top bot types
     ax = axes[2, 1]
-    if result.bot_types:
-        bots, counts = zip(*result.bot_types.most_common(8))
+    if data.top_bot_types:
+        bots, counts = zip(*data.top_bot_types)
         ax.bar(bots, counts, color="#FF9800")
         ax.set_title("Top bot types")
         ax.tick_params(axis="x", rotation=45, labelsize=9)
@@ -621,8 +1229,8 @@ def visualize_data(result: AnalysisResult) -> None:
 
     # 9. Bot status codes
     ax = axes[2, 2]
-    if bot_stats["bot_status_codes"]:
-        codes, counts = zip(*sorted(bot_stats["bot_status_codes"].items()))
+    if data.bot_status_codes:
+        codes, counts = zip(*data.bot_status_codes)
         x_pos = range(len(codes))
         ax.bar(x_pos, counts, color="#4CAF50")
         ax.set_xticks(list(x_pos))
@@ -655,17 +1263,15 @@ def main() -> None:
 
     log.info("Analysing log file: %s", LOCAL_LOG_FILE)
 
-    log.info("Counting IP requests...")
-    ip_counts = collect_ip_counts(LOCAL_LOG_FILE)
-    high_request_ips = {ip for ip, count in ip_counts.items() if count > HIGH_REQUEST_THRESHOLD}
-    log.info("Found %d IPs with >%d requests", len(high_request_ips), HIGH_REQUEST_THRESHOLD)
-
     log.info("Analysing log entries...")
-    result = analyse_entries(LOCAL_LOG_FILE, high_request_ips)
+    result = analyse_entries(LOCAL_LOG_FILE)
+    log.info("Found %d IPs with >%d requests", len(result.high_request_ips), HIGH_REQUEST_THRESHOLD)
+
+    rt_stats = response_time_stats(result.response_times)
 
-    print_report(result)
+    print_report(result, rt_stats)
     save_problematic_report(result)
-    visualize_data(result)
+    visualize_data(build_dashboard_data(result, rt_stats))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+"""
+Tests for the log parser and analysis in Main.py.
+
+Run with:  python -m unittest test_main
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import Main
+
+UA = b"Mozilla/5.0 (X11; Linux x86_64) Firefox/120.0"
+
+
+def make_line(bytes_sent: int = 1234, response_time: int = 120) -> bytes:
+    """Build one log line in the server's format with the given numeric fields."""
+    return (
+        b'10.0.0.1 - YES - [01/07/2025:06:00:02] "GET /index.html HTTP/1.1" 200 '
+        + str(bytes_sent).encode() + b' "-" "' + UA + b'" '
+        + str(response_time).encode() + b"\n"
+    )
+
+
+class AnalysisTestCase(unittest.TestCase):
+    """Helpers for running analyse_entries over a temporary log file."""
+
+    def write_log(self, *lines: bytes) -> str:
+        fd, path = tempfile.mkstemp(suffix=".log")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"".join(lines))
+        return path
+
+    def analyse(self, *lines: bytes) -> Main.AnalysisResult:
+        return Main.analyse_entries(self.write_log(*lines), workers=1)
+
+
+class SplitLogLineTests(unittest.TestCase):
+    """split_log_line must agree with LOG_RE whenever it accepts a line."""
+
+    BASE = make_line()
+    VARIANTS = {
+        "well formed": BASE,
+        "no trailing newline": BASE.rstrip(b"\n"),
+        "crlf ending": BASE.replace(b"\n", b"\r\n"),
+        "leading whitespace": b"  " + BASE,
+        "trailing whitespace": BASE.replace(b"\n", b"  \n"),
+        "leading tab": b"\t" + BASE,
+        "tab in request": BASE.replace(b"GET /index", b"GET\t/index"),
+        "tab after status": BASE.replace(b" 200 ", b" 200\t"),
+        "cr in prefix": BASE.replace(b"10.0.0.1 -", b"10.0.0.1\r -"),
+        "extra quote in user agent": BASE.replace(b"Firefox", b'Fire"fox'),
+        "extra quote in path": BASE.replace(b"/index", b'/in"dex'),
+        "missing referer quote": BASE.replace(b' "-" ', b' "- '),
+        "missing request quote": BASE.replace(b'HTTP/1.1"', b"HTTP/1.1"),
+        "non-digit status": BASE.replace(b" 200 ", b" 2x0 "),
+        "four-digit status": BASE.replace(b" 200 ", b" 2000 "),
+        "empty ip": BASE.replace(b"10.0.0.1 ", b" "),
+        "empty auth": BASE.replace(b"- YES -", b"-  -"),
+    }
+
+    def test_matches_regex_or_rejects(self):
+        for name, line in self.VARIANTS.items():
+            with self.subTest(name):
+                fields = Main.split_log_line(line)
+                if fields is not None:
+                    match = Main.LOG_RE.fullmatch(line)
+                    self.assertIsNotNone(match)
+                    self.assertEqual(fields, match.groups())
+
+    def test_accepts_common_line_endings(self):
+        for name in ("well formed", "no trailing newline", "crlf ending"):
+            with self.subTest(name):
+                self.assertIsNotNone(Main.split_log_line(self.VARIANTS[name]))
+
+    def test_parse_falls_back_to_regex(self):
+        for name in ("leading whitespace", "extra quote in path"):
+            with self.subTest(name):
+                line = self.VARIANTS[name]
+                self.assertIsNone(Main.split_log_line(line))
+                match = Main.LOG_RE.fullmatch(line)
+                self.assertIsNotNone(match)
+                entry = Main.parse_log_line(line)
+                self.assertIsNotNone(entry)
+                self.assertEqual(entry.path, match.group(5).decode())
+
+
+class TimestampTests(unittest.TestCase):
+    CASES = [
+        ("01/07/2025:06:00:02", True),
+        ("29/02/2024:12:00:00", True),    # leap year
+        ("29/02/2025:12:00:00", False),   # not a leap year
+        ("31/04/2025:12:00:00", False),   # April has 30 days
+        ("30/04/2025:23:59:59", True),
+        ("01/07/2025:24:00:00", False),
+        ("01/07/2025:23:59:60", False),   # no leap seconds, as with strptime
+        ("01/07/0000:12:00:00", False),   # datetime has no year 0
+        ("01/07/0001:12:00:00", True),
+        ("00/07/2025:12:00:00", False),
+        ("01/13/2025:12:00:00", False),
+        # strptime accepted non-padded fields; the log always pads them,
+        # so anything else is now flagged
+        ("1/07/2025:06:00:02", False),
+        ("01/7/2025:06:00:02", False),
+        ("01/07/2025:6:00:02", False),
+        ("01/07/2025 06:00:02", False),
+        ("", False),
+    ]
+
+    def test_cases(self):
+        for timestamp, valid in self.CASES:
+            with self.subTest(timestamp):
+                self.assertIs(Main.is_valid_timestamp(timestamp), valid)
+
+    def test_non_padded_timestamp_is_flagged(self):
+        line = make_line().replace(b"[01/07/2025:", b"[1/07/2025:")
+        entry = Main.parse_log_line(line)
+        self.assertIsNotNone(entry)
+        self.assertTrue(Main.text_issue_flags(entry, False, False) & Main.FLAG_BAD_TS)
+
+
+class ParseLogLineTests(unittest.TestCase):
+    def test_well_formed_line(self):
+        entry = Main.parse_log_line(make_line())
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.ip, "10.0.0.1")
+        self.assertEqual(entry.status, 200)
+        self.assertEqual(entry.bytes_sent, 1234)
+        self.assertEqual(entry.response_time, 120)
+
+    def test_largest_response_time_is_accepted(self):
+        entry = Main.parse_log_line(make_line(response_time=Main.MAX_RESPONSE_TIME_MS))
+        self.assertEqual(entry.response_time, Main.MAX_RESPONSE_TIME_MS)
+
+    def test_oversized_response_time_is_malformed(self):
+        self.assertIsNone(Main.parse_log_line(make_line(response_time=Main.MAX_RESPONSE_TIME_MS + 1)))
+        self.assertIsNone(Main.parse_log_line(make_line(response_time=3_000_000_000)))
+
+    def test_largest_bytes_sent_is_accepted(self):
+        entry = Main.parse_log_line(make_line(bytes_sent=Main.MAX_BYTES_SENT))
+        self.assertEqual(entry.bytes_sent, Main.MAX_BYTES_SENT)
+
+    def test_oversized_bytes_sent_is_malformed(self):
+        self.assertIsNone(Main.parse_log_line(make_line(bytes_sent=Main.MAX_BYTES_SENT + 1)))
+
+
+class AnalyseEntriesTests(AnalysisTestCase):
+    def test_oversized_response_time_counts_as_malformed(self):
+        result = self.analyse(make_line(), make_line(response_time=3_000_000_000))
+        self.assertEqual(result.total_lines, 2)
+        self.assertEqual(result.problem_counts[Main.MSG_MALFORMED], 1)
+        self.assertEqual(result.response_times.tolist(), [120])
+
+    def test_oversized_bytes_sent_counts_as_malformed(self):
+        result = self.analyse(make_line(), make_line(bytes_sent=2**64))
+        self.assertEqual(result.total_lines, 2)
+        self.assertEqual(result.problem_counts[Main.MSG_MALFORMED], 1)
+
+    def test_large_values_that_fit_are_reported(self):
+        result = self.analyse(
+            make_line(bytes_sent=Main.MAX_BYTES_SENT, response_time=Main.MAX_RESPONSE_TIME_MS)
+        )
+        self.assertNotIn(Main.MSG_MALFORMED, result.problem_counts)
+        self.assertEqual(result.problem_counts[Main.MSG_LARGE], 1)
+        self.assertEqual(result.problem_counts[Main.MSG_SLOW], 1)
+        entries = result.problematic_entries
+        self.assertEqual(entries.response_time.tolist(), [Main.MAX_RESPONSE_TIME_MS])
+        self.assertEqual(entries.bytes_sent.tolist(), [Main.MAX_BYTES_SENT])
+
+
+class ChunkingTests(AnalysisTestCase):
+    """Splitting the file into byte ranges and blocks must not change the result."""
+
+    def setUp(self):
+        # Force one chunk per worker and several blocks per chunk
+        for name, value in (("MIN_CHUNK_BYTES", 1), ("READ_BLOCK_BYTES", 300)):
+            patcher = mock.patch.object(Main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assertSameResult(self, expected: Main.AnalysisResult, actual: Main.AnalysisResult):
+        self.assertEqual(actual.total_lines, expected.total_lines)
+        self.assertEqual(actual.problem_lines, expected.problem_lines)
+        self.assertEqual(actual.problem_counts, expected.problem_counts)
+        self.assertEqual(actual.ip_addresses, expected.ip_addresses)
+        self.assertEqual(actual.high_request_ips, expected.high_request_ips)
+        self.assertEqual(actual.response_times.tolist(), expected.response_times.tolist())
+        self.assertEqual(list(actual.problematic_entries.rows()),
+                         list(expected.problematic_entries.rows()))
+
+    def test_chunked_matches_single_chunk(self):
+        # Enough lines from one IP to cross HIGH_REQUEST_THRESHOLD across chunks
+        lines = [make_line(response_time=100 + 17 * i) for i in range(Main.HIGH_REQUEST_THRESHOLD + 5)]
+        lines[3] = b"\n"
+        lines[7] = b"10.0.0.2 - not a log line\n"
+        lines[11] = lines[11].replace(b"\n", b"\r\n")
+        lines[-1] = lines[-1].rstrip(b"\n")
+        path = self.write_log(*lines)
+
+        expected = Main.analyse_entries(path, workers=1)
+        self.assertEqual(expected.total_lines, len(lines))
+        self.assertEqual(expected.problem_counts[Main.MSG_MALFORMED], 2)
+        self.assertEqual(expected.problematic_entries.line.tolist()[:3], [1, 2, 3])
+        for workers in (2, 3, 7):
+            with self.subTest(workers=workers):
+                self.assertSameResult(expected, Main.analyse_entries(path, workers=workers))
+
+    def test_empty_file(self):
+        result = Main.analyse_entries(self.write_log(), workers=4)
+        self.assertEqual(result.total_lines, 0)
+        self.assertEqual(result.problem_lines, 0)
+        self.assertFalse(result.problem_counts)
+        self.assertEqual(result.response_times.size, 0)
+        self.assertEqual(len(result.problematic_entries), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()